@@ -25,34 +25,18 @@
 # can be changed via method call. If weightings do not sum to 1, they will be normalised so that
 # they do.
 
+import itertools as it
 import random as rd
 import typing as ty
 import src.utils
 
 # letters that aren't allowed to be double letters
-_non_double_letters = ["a", "h", "i", "j", "q", "u", "v", "w", "x", "y"]
+_non_double_letters = frozenset("ahijquvwxy")
 
-
-def _construct_station_name(prefix: ty.Optional[str], former: str, latter: ty.Optional[str],
-                             suffix: ty.Optional[str]) -> str:
-    """
-    Given the parts of a station name, combine them into a station name, including capitalisation.
-    Has the form [Prefix] [Former][latter] [Suffix]
-    :param prefix: The prefix, if not to be included should be None. Defaults to None.
-    :param former: The former, must be included.
-    :param latter: The latter, if not to be included should be None. Defaults to None.
-    :param suffix: The suffix, if not to be included should be None. Defaults to None.
-    :return: The station name as a string.
-    """
-    return_str = ""
-    if prefix is not None:
-        return_str += prefix.capitalize() + " "
-    return_str += former.capitalize()
-    if latter is not None:
-        return_str += latter
-    if suffix is not None:
-        return_str += " " + suffix.capitalize()
-    return return_str
+# the possible name shapes, in the same order as their weights in StationNameGenerator
+_prefix_shapes = (False, True)
+_latter_suffix_shapes = ("just_latter", "both", "just_suffix")
+_double_letter_shapes = (True, False)
 
 
 class StationNameGenerator:
@@ -64,31 +48,46 @@ class StationNameGenerator:
         "prefix", "former", "latter", "suffix". All other keys are ignored.
         """
         # check arguments
-        path_keys = [*list_paths]
         required_keys = ["prefix", "former", "latter", "suffix"]
-        if not all([i in path_keys for i in required_keys]):
+        missing_keys = set(required_keys) - list_paths.keys()
+        if missing_keys:
             raise ValueError("The dictionary of filepaths of part lists for a StationNameGenerator " +
-                           "have keys including 'prefix', 'former', 'latter', and 'suffix'.")
+                             "must have keys including 'prefix', 'former', 'latter', and 'suffix'. " +
+                             "Missing keys: " + str(sorted(missing_keys)))
         self.name_parts = {}
         for i in required_keys:
-            new_name_list = []
             try:
                 with open(list_paths[i], "r") as f:
-                    for fline in f:
-                        new_name_list.append(fline.split("\n"))
+                    new_name_list = tuple(fline.rstrip("\n") for fline in f)
             except OSError:
                 raise ValueError("The name parts list file with the key '" + i + "' was not a " +
                                  "valid file.")
             self.name_parts[i] = new_name_list
+        # capitalise the parts that start a word once here, rather than for every name generated,
+        # and give prefixes and suffixes the space that separates them from the former and latter,
+        # so that a name is made by just adding its parts together. The "_part" tables hold these
+        # ready-to-add prefixes and suffixes, and "former_cap" holds the capitalised formers.
+        # s[:1].upper() + s[1:] is used rather than s.capitalize(), as the name parts are already
+        # lower case so the rest of the string doesn't need to be lowercased
+        self.name_parts["prefix_part"] = tuple(
+            s[:1].upper() + s[1:] + " " for s in self.name_parts["prefix"]
+        )
+        self.name_parts["former_cap"] = tuple(
+            s[:1].upper() + s[1:] for s in self.name_parts["former"]
+        )
+        self.name_parts["suffix_part"] = tuple(
+            " " + s[:1].upper() + s[1:] for s in self.name_parts["suffix"]
+        )
 
-        # make user seed at least 12 digits long
-        seed_checked = False
+        # make user seed at least 12 digits long. Concatenating a d digit number with itself is the
+        # same as multiplying it by 10^d + 1, which avoids converting to and from a string
+        if user_seed < 1:
+            raise ValueError("The user seed for a StationNameGenerator must be a positive integer.")
         long_seed = user_seed
-        while not seed_checked:
-            if long_seed > 99999999999:
-                seed_checked = True
-            else:
-                long_seed = int(str(long_seed) + str(long_seed))
+        num_digits = len(str(long_seed))
+        while long_seed <= 99999999999:
+            long_seed *= 10 ** num_digits + 1
+            num_digits *= 2
         self.userseed = long_seed
 
         # set default name shape weightings
@@ -105,6 +104,17 @@ class StationNameGenerator:
             0.5, # yes double letter allowed
             0.5 # no double letter allowed
         )
+        self._update_cum_weights()
+
+    def _update_cum_weights(self):
+        """
+        Store the cumulative weights of the name shape weights, so that rngenerator.choices doesn't
+        need to accumulate them each time names are generated. Must be called whenever the weights
+        are changed.
+        """
+        self._cum_weights_prefix = list(it.accumulate(self.nameshape_weights_prefix))
+        self._cum_weights_latter_suffix = list(it.accumulate(self.nameshape_weights_latter_suffix))
+        self._cum_weights_double_letter = list(it.accumulate(self.nameshape_weights_double_letter))
 
     def update_weights(
             self,
@@ -133,7 +143,8 @@ class StationNameGenerator:
             self.nameshape_weights_latter_suffix = tuple([i / latter_sum for i in latter_weights])
         if double_weights is not None:
             double_sum = sum(list(double_weights))
-            self.nameshape_weights_latter_suffix = tuple([i / double_sum for i in double_weights])
+            self.nameshape_weights_double_letter = tuple([i / double_sum for i in double_weights])
+        self._update_cum_weights()
 
     def generate_names(self, n: int, num_names: int) -> list[str]:
         """
@@ -149,77 +160,68 @@ class StationNameGenerator:
             secondary_seed=n
         )
         rngenerator = rd.Random(newseed)
-        use_prefix = rngenerator.choices(
-            population=[False, True],
-            weights=self.nameshape_weights_prefix,
+        # local names for everything used repeatedly below, to avoid repeated attribute and
+        # dictionary lookups, especially inside the comprehensions
+        choices = rngenerator.choices
+        former_pool = self.name_parts["former"]
+        former_cap_pool = self.name_parts["former_cap"]
+        non_double_letters = _non_double_letters
+
+        use_prefix = choices(
+            population=_prefix_shapes,
+            cum_weights=self._cum_weights_prefix,
             k=num_names
         )
-        use_latter_suffix = rngenerator.choices(
-            population=[
-                "just_latter",
-                "both",
-                "just_suffix"
-            ],
-            weights=self.nameshape_weights_latter_suffix,
+        use_latter_suffix = choices(
+            population=_latter_suffix_shapes,
+            cum_weights=self._cum_weights_latter_suffix,
             k=num_names
         )
-        use_double_letters = rngenerator.choices(
-            population=[True, False],
-            weights=self.nameshape_weights_double_letter,
+        use_double_letters = choices(
+            population=_double_letter_shapes,
+            cum_weights=self._cum_weights_double_letter,
             k=num_names
         )
 
-        prefixes = []
-        formers = [
-            i[0] for i in rngenerator.choices(
-            population=self.name_parts["former"],
+        # choose indices rather than formers so that both the capitalised former (for the name) and
+        # the raw former (for the double letter check) can be used
+        former_indices = choices(
+            population=range(len(former_pool)),
             k=num_names
         )
-        ]
-        latters = []
-        suffixes = []
-        former_num = 0
-        for i, j, k in zip(use_prefix, use_latter_suffix, use_double_letters):
-            if i:
-                prefixes.append(
-                    rngenerator.choice(self.name_parts["prefix"])[0]
-                )
-            else:
-                prefixes.append(None)
-
-            match j:
-                case "just_latter":
-                    use_latter = True
-                    use_suffix = False
-                case "just_suffix":
-                    use_latter = False
-                    use_suffix = True
-                case "both":
-                    use_latter = True
-                    use_suffix = True
-                case _:
-                    raise ValueError("use_latter_suffix was not one of the three values it " +
-                                     "should be?!?")
+        formers = [former_cap_pool[i] for i in former_indices]
+        former_lasts = [former_pool[i][-1] for i in former_indices]
+        # draw a candidate prefix, latter, and suffix for every name up front, then keep or discard
+        # them per name below, rather than calling rngenerator.choice for each name
+        cand_prefixes = choices(
+            population=self.name_parts["prefix_part"],
+            k=num_names
+        )
+        cand_latters = choices(
+            population=self.name_parts["latter"],
+            k=num_names
+        )
+        cand_suffixes = choices(
+            population=self.name_parts["suffix_part"],
+            k=num_names
+        )
+        # translate the name shapes into whether each name has a latter and whether it has a suffix
+        use_latter_mask = [i != "just_suffix" for i in use_latter_suffix]
+        use_suffix_mask = [i != "just_latter" for i in use_latter_suffix]
 
-            if use_latter:
-                chosen_latter = rngenerator.choice(self.name_parts["latter"])[0]
-                if ((not k) or (chosen_latter[0] in _non_double_letters)) \
-                        and (chosen_latter[0] == formers[former_num][-1]):
-                    latters.append(chosen_latter[1:-1])
-                else:
-                    latters.append(chosen_latter)
-            else:
-                latters.append(None)
-            if use_suffix:
-                suffixes.append(
-                    rngenerator.choice(self.name_parts["suffix"])[0]
-                )
-            else:
-                suffixes.append(None)
-            former_num += 1
+        # parts that are not used are empty strings, so that they add nothing to the name
+        prefixes = [i if j else "" for i, j in zip(cand_prefixes, use_prefix)]
+        # latters have their first letter removed if it would make a double letter that isn't allowed
+        latters = [
+            (i[1:] if ((not k) or (i[0] in non_double_letters)) and (i[0] == m) else i)
+            if j else ""
+            for i, j, k, m in zip(cand_latters, use_latter_mask, use_double_letters, former_lasts)
+        ]
+        suffixes = [i if j else "" for i, j in zip(cand_suffixes, use_suffix_mask)]
 
+        # names have the form [Prefix] [Former][latter] [Suffix]
         return [
-            _construct_station_name(i, j, k, m) for i, j, k, m in zip(
+            i + j + k + m for i, j, k, m in zip(
                 prefixes,
                 formers,
                 latters,
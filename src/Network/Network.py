@@ -60,41 +60,43 @@ class Network(nx.Graph):
     def _generate_station_names(self, num_names: int) -> list[str]:
         """
         Given a number of station names to generate, genenrate that many station names that are
-        unique. This is done by making sure none of the generated names appear in self.station_names.
-        The seed used is the user_seed modified with the number of stations in the network plus 1.
-        The plus 1 is to make sure n is always > 0, as an n of 0 causes a /0 error. See the
-        comments in /src/Naming/StationNameGenerator.py for more info.
+        unique. Each generated name is checked against a set of the names in self.station_names and
+        the new names accepted so far, and repeats are discarded. If any are discarded, more names
+        are generated until there are enough. If a whole batch of generated names are all repeats,
+        the name parts are treated as having run out of new names and a ValueError is raised.
+        The first batch of names uses the user_seed modified with n, the number of stations in the
+        network plus 1. The plus 1 is to make sure n is always > 0, as an n of 0 causes a /0 error.
+        After each batch, n is moved on by the number of names generated, so that any further batch
+        uses a different seed. See the comments in /src/Naming/StationNameGenerator.py for more
+        info.
         :param num_names: The number of new names to generate.
         :return: a list of unique station names.
         """
-        generated_names = self.sn_gen.generate_names(
-            n=len(self.station_names) + 1,
-            num_names=num_names
-        )
-
-        # check which new names are repeats of earlier new names in the list. The chances of this
-        # happening are infintessimally small, but check anyway.
-        intra_repeats = [generated_names[i] in generated_names[:i] for i in range(num_names)]
-        # check which new names are repeats of pre-existing stations. Still very, very unlikely,
-        # but check anyway.
-        inter_repeats = [i in self.station_names for i in generated_names]
-        repeats = [i or j for i, j in zip(intra_repeats, inter_repeats)]
-
-        # if no repeats exist, then the newly generated names are all fine to use
-        if not any(repeats):
-            return generated_names
-
-        # however, if there are repeats, then new names will need to be generated
-        num_new_required = repeats.count(True)
-        new_names = self._generate_station_names(num_names=num_new_required)
-        new_name_index = 0
+        # the chances of a repeat are infintessimally small, but check anyway. A few more names
+        # than needed are generated so that any repeats can be replaced without generating again.
+        existing_names = set(self.station_names)
         names_to_return = []
-        for i in len(generated_names):
-            if repeats[i]:
-                names_to_return.append(new_names[new_name_index])
-                new_name_index += 1
-            else:
-                names_to_return.append(generated_names[i])
+        n = len(self.station_names) + 1
+        while len(names_to_return) < num_names:
+            num_required = num_names - len(names_to_return)
+            generated_names = self.sn_gen.generate_names(
+                n=n,
+                num_names=num_required + max(4, num_required // 50)
+            )
+            n += len(generated_names)
+            num_found = len(names_to_return)
+            for i in generated_names:
+                if i not in existing_names:
+                    existing_names.add(i)
+                    names_to_return.append(i)
+                    if len(names_to_return) == num_names:
+                        break
+            # if a whole batch was repeats, the name parts have very likely run out of new names, so
+            # stop rather than generating batches forever
+            if len(names_to_return) == num_found:
+                raise ValueError("Could not generate " + str(num_names) + " unique station names; " +
+                                 "only " + str(num_found) + " new names were found before every " +
+                                 "name in a batch was a repeat.")
         return names_to_return
 
     def generate_disconnected_stations(self, num_stations):
@@ -4,9 +4,11 @@
 
 
 class NetworkLine:
+    # __weakref__ is needed as NetworkStation objects hold weak references to their lines
+    __slots__ = ("name", "colour", "__weakref__")
+
     def __init__(self, line_name: str, line_colour: tuple[int, int, int]):
-        for i in line_colour:
-            if not 0 <= i <= 255:
-                raise ValueError("The RGB colour values for a NetworkLine must be between 0 and 255.")
+        if min(line_colour) < 0 or max(line_colour) > 255:
+            raise ValueError("The RGB colour values for a NetworkLine must be between 0 and 255.")
         self.name = line_name
         self.colour = line_colour
@@ -8,7 +8,7 @@
 #         that have been used so that no repeats occur. Therefore, this should be assigned at object
 #         initialisation and should not be changed. This is ensured by making name access a property
 #         object.
-# .lines: a list of the NetworkLine objects that the station is part of
+# .lines: a weak set of the NetworkLine objects that the station is part of
 #
 
 import weakref as wr
@@ -16,9 +16,11 @@ from src.Network.NetworkLine import NetworkLine
 
 
 class NetworkStation:
+    __slots__ = ("_name", "lines")
+
     def __init__(self, station_name: str):
         self._name = station_name
-        self.lines = []
+        self.lines = wr.WeakSet()
 
     def __hash__(self):
         return hash(self.name)
@@ -29,4 +31,4 @@ class NetworkStation:
         return self._name
 
     def add_line(self, network_line: NetworkLine):
-        self.lines.append(wr.ref(network_line))  # using weakref to keep function GC-safe
+        self.lines.add(network_line)  # using a WeakSet to keep function GC-safe
@@ -1,6 +1,8 @@
-import math
 import pathlib as pl
 
+# characters that are used as they are by seed_integer, rather than as their unicode code
+_digits = frozenset("0123456789")
+
 
 def project_root() -> pl.Path:
     return pl.Path(__file__).parent.parent
@@ -14,7 +16,8 @@ def new_seed(primary_seed: int, secondary_seed: int) -> int:
     if secondary_seed == 0:
         raise ValueError("Cannot create a new seed with a secondary seed of 0, as it will cause a" +
                          " divide-by-zero error.")
-    return int(math.floor((float(primary_seed) - float(secondary_seed)) / float(secondary_seed)))
+    # integer floor division, as converting to float loses precision for seeds larger than 2^53
+    return (primary_seed - secondary_seed) // secondary_seed
 
 
 def seed_integer(seed: str) -> int:
@@ -22,10 +25,4 @@ def seed_integer(seed: str) -> int:
     Turns a seed from a string into an integer. It does this by iterating over the string; if the
     character is a digit 0 to 9, then use that digit. Else use the unicode code for that character.
     """
-    return_str = ""
-    for i in seed:
-        try:
-            return_str += str(int(i))
-        except ValueError:
-            return_str += str(ord(i))
-    return int(return_str)
+    return int("".join([i if i in _digits else str(ord(i)) for i in seed]))